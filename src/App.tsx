@@ -70,9 +70,15 @@ function App() {
     const newSlideOrder: SlideItem[] = [];
     let orderCounter = 0;
 
+    // Ensembles d'identifiants pour des tests d'appartenance en O(1)
+    // au lieu d'un find() linéaire par élément
+    const orderedIds = new Set(slideOrder.map(item => item.id));
+    const readingIds = new Set(readings.map(r => r.id));
+    const songIds = new Set(songs.map(s => s.id));
+
     // Ajouter les nouvelles lectures qui ne sont pas déjà dans l'ordre
     readings.forEach(reading => {
-      if (!slideOrder.find(item => item.id === reading.id)) {
+      if (!orderedIds.has(reading.id)) {
         newSlideOrder.push({
           id: reading.id,
           type: 'reading',
@@ -83,7 +89,7 @@ function App() {
 
     // Ajouter les nouveaux chants qui ne sont pas déjà dans l'ordre
     songs.forEach(song => {
-      if (!slideOrder.find(item => item.id === song.id)) {
+      if (!orderedIds.has(song.id)) {
         newSlideOrder.push({
           id: song.id,
           type: 'song',
@@ -93,13 +99,9 @@ function App() {
     });
 
     // Conserver l'ordre existant et ajouter les nouveaux éléments
-    const existingValidItems = slideOrder.filter(item => {
-      if (item.type === 'reading') {
-        return readings.find(r => r.id === item.id);
-      } else {
-        return songs.find(s => s.id === item.id);
-      }
-    });
+    const existingValidItems = slideOrder.filter(item =>
+      item.type === 'reading' ? readingIds.has(item.id) : songIds.has(item.id)
+    );
 
     const finalOrder = [...existingValidItems, ...newSlideOrder];
     
@@ -1,6 +1,6 @@
 import React from 'react';
 import { Eye, Download } from 'lucide-react';
-import { LiturgyPresentation, SlideItem } from '../types/liturgy';
+import { LiturgyPresentation } from '../types/liturgy';
 import { PowerPointService } from '../services/powerpoint';
 
 interface PreviewPanelProps {
@@ -24,6 +24,34 @@ export default function PreviewPanel({ presentation }: PreviewPanelProps) {
     }
   };
 
+  // Résoudre une seule fois l'ordre trié et le contenu de chaque slide,
+  // au lieu d'un find() par slide à chaque rendu
+  const slideEntries = React.useMemo(() => {
+    if (!presentation) return [];
+
+    const readingsById = new Map(presentation.readings.map(r => [r.id, r]));
+    const songsById = new Map(presentation.songs.map(s => [s.id, s]));
+
+    return [...presentation.slideOrder]
+      .sort((a, b) => a.order - b.order)
+      .map(slideItem => {
+        if (slideItem.type === 'reading') {
+          const reading = readingsById.get(slideItem.id);
+          return reading ? {
+            id: slideItem.id,
+            title: reading.title,
+            color: 'bg-green-600'
+          } : null;
+        }
+        const song = songsById.get(slideItem.id);
+        return song ? {
+          id: slideItem.id,
+          title: song.title,
+          color: 'bg-amber-600'
+        } : null;
+      })
+      .filter((entry): entry is NonNullable<typeof entry> => entry !== null);
+  }, [presentation]);
 
   if (!presentation) {
     return (
@@ -44,25 +72,6 @@ export default function PreviewPanel({ presentation }: PreviewPanelProps) {
   // Calculer le nombre total de slides (titre + slides ordonnées)
   const totalSlides = 1 + presentation.slideOrder.length;
 
-  const getSlideInfo = (slideItem: SlideItem, index: number) => {
-    if (slideItem.type === 'reading') {
-      const reading = presentation.readings.find(r => r.id === slideItem.id);
-      return reading ? {
-        title: reading.title,
-        color: 'bg-green-600'
-      } : null;
-    } else {
-      const song = presentation.songs.find(s => s.id === slideItem.id);
-      return song ? {
-        title: song.title,
-        color: 'bg-amber-600'
-      } : null;
-    }
-  };
-
-  // Trier les slides par ordre
-  const sortedSlides = [...presentation.slideOrder].sort((a, b) => a.order - b.order);
-
   return (
     <div className="bg-white rounded-lg shadow-md p-6">
       <div className="flex items-center justify-between mb-6">
@@ -111,23 +120,18 @@ export default function PreviewPanel({ presentation }: PreviewPanelProps) {
               <span className="text-gray-700">Page de titre</span>
             </div>
 
-            {sortedSlides.map((slideItem, index) => {
-              const slideInfo = getSlideInfo(slideItem, index);
-              if (!slideInfo) return null;
-
-              return (
-                <div key={slideItem.id} className="flex items-center gap-3 p-3 bg-gray-50 rounded-lg">
-                  <div className={`w-8 h-6 ${slideInfo.color} rounded flex items-center justify-center`}>
-                    <span className="text-white text-xs font-bold">{index + 2}</span>
-                  </div>
-                  <span className="text-gray-700">{slideInfo.title}</span>
+            {slideEntries.map((slideInfo, index) => (
+              <div key={slideInfo.id} className="flex items-center gap-3 p-3 bg-gray-50 rounded-lg">
+                <div className={`w-8 h-6 ${slideInfo.color} rounded flex items-center justify-center`}>
+                  <span className="text-white text-xs font-bold">{index + 2}</span>
                 </div>
-              );
-            })}
+                <span className="text-gray-700">{slideInfo.title}</span>
+              </div>
+            ))}
           </div>
         </div>
 
-        {sortedSlides.length > 0 && (
+        {slideEntries.length > 0 && (
           <div className="bg-green-50 p-4 rounded-lg border border-green-200">
             <p className="text-green-800 text-sm">
               ✓ Présentation prête à être exportée en PowerPoint
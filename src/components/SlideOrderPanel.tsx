@@ -10,27 +10,36 @@ interface SlideOrderPanelProps {
 }
 
 export default function SlideOrderPanel({ readings, songs, slideOrder, onReorderSlide }: SlideOrderPanelProps) {
-  const getSlideContent = (slideItem: SlideItem) => {
-    if (slideItem.type === 'reading') {
-      const reading = readings.find(r => r.id === slideItem.id);
-      return reading ? {
-        title: reading.title,
-        subtitle: reading.reference,
-        icon: BookOpen,
-        color: 'text-green-600 bg-green-50'
-      } : null;
-    } else {
-      const song = songs.find(s => s.id === slideItem.id);
-      return song ? {
-        title: song.title,
-        subtitle: song.category,
-        icon: Music,
-        color: 'text-amber-600 bg-amber-50'
-      } : null;
-    }
-  };
+  // Résoudre une seule fois l'ordre trié et le contenu de chaque slide,
+  // au lieu d'un find() par slide à chaque rendu
+  const slideEntries = React.useMemo(() => {
+    const readingsById = new Map(readings.map(r => [r.id, r]));
+    const songsById = new Map(songs.map(s => [s.id, s]));
 
-  const sortedSlides = [...slideOrder].sort((a, b) => a.order - b.order);
+    return [...slideOrder]
+      .sort((a, b) => a.order - b.order)
+      .map(slideItem => {
+        if (slideItem.type === 'reading') {
+          const reading = readingsById.get(slideItem.id);
+          return reading ? {
+            id: slideItem.id,
+            title: reading.title,
+            subtitle: reading.reference,
+            icon: BookOpen,
+            color: 'text-green-600 bg-green-50'
+          } : null;
+        }
+        const song = songsById.get(slideItem.id);
+        return song ? {
+          id: slideItem.id,
+          title: song.title,
+          subtitle: song.category,
+          icon: Music,
+          color: 'text-amber-600 bg-amber-50'
+        } : null;
+      })
+      .filter((entry): entry is NonNullable<typeof entry> => entry !== null);
+  }, [readings, songs, slideOrder]);
 
   return (
     <div className="bg-white rounded-lg shadow-md p-6 mb-6">
@@ -39,21 +48,18 @@ export default function SlideOrderPanel({ readings, songs, slideOrder, onReorder
         <h2 className="text-xl font-semibold text-gray-800">Ordre des slides</h2>
       </div>
 
-      {sortedSlides.length === 0 ? (
+      {slideEntries.length === 0 ? (
         <div className="text-center py-8 text-gray-500">
           <p>Aucune slide dans la présentation</p>
           <p className="text-sm mt-2">Ajoutez des chants ou sélectionnez une date pour voir les lectures</p>
         </div>
       ) : (
         <div className="space-y-2">
-          {sortedSlides.map((slideItem, index) => {
-            const content = getSlideContent(slideItem);
-            if (!content) return null;
-
+          {slideEntries.map((content, index) => {
             const Icon = content.icon;
 
             return (
-              <div key={slideItem.id} className={`flex items-center gap-3 p-3 rounded-lg border ${content.color} border-opacity-50`}>
+              <div key={content.id} className={`flex items-center gap-3 p-3 rounded-lg border ${content.color} border-opacity-50`}>
                 <div className="flex items-center gap-3 flex-1">
                   <span className="bg-blue-600 text-white text-sm font-bold px-2 py-1 rounded min-w-[2rem] text-center">
                     {index + 1}
@@ -67,7 +73,7 @@ export default function SlideOrderPanel({ readings, songs, slideOrder, onReorder
 
                 <div className="flex flex-col gap-1">
                   <button
-                    onClick={() => onReorderSlide(slideItem.id, 'up')}
+                    onClick={() => onReorderSlide(content.id, 'up')}
                     disabled={index === 0}
                     className="p-1 text-gray-600 hover:bg-gray-100 rounded disabled:opacity-30 disabled:cursor-not-allowed transition-colors"
                     title="Monter"
@@ -75,8 +81,8 @@ export default function SlideOrderPanel({ readings, songs, slideOrder, onReorder
                     <ChevronUp className="w-4 h-4" />
                   </button>
                   <button
-                    onClick={() => onReorderSlide(slideItem.id, 'down')}
-                    disabled={index === sortedSlides.length - 1}
+                    onClick={() => onReorderSlide(content.id, 'down')}
+                    disabled={index === slideEntries.length - 1}
                     className="p-1 text-gray-600 hover:bg-gray-100 rounded disabled:opacity-30 disabled:cursor-not-allowed transition-colors"
                     title="Descendre"
                   >
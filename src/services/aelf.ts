@@ -22,31 +22,68 @@ interface AELFApiResponse {
   }>;
 }
 
+// Entités HTML rencontrées dans les textes AELF et leur équivalent texte
+const HTML_ENTITIES: Record<string, string> = {
+  '&nbsp;': ' ',
+  '&amp;': '&',
+  '&lt;': '<',
+  '&gt;': '>',
+  '&quot;': '"',
+  '&#39;': "'",
+  '&rsquo;': "'",
+  '&lsquo;': "'",
+  '&rdquo;': '"',
+  '&ldquo;': '"'
+};
+
+// Expressions régulières compilées une seule fois au chargement du module
+const HTML_TAG_REGEX = /<[^>]*>/g;
+const HTML_ENTITY_REGEX = new RegExp(Object.keys(HTML_ENTITIES).join('|'), 'g');
+const MULTIPLE_SPACES_REGEX = /\s+/g;
+
 // Service pour récupérer les textes liturgiques de l'AELF
 export class AELFService {
   private static readonly BASE_URL = '/api/aelf';
   private static readonly ZONE = 'france';
 
+  // Nouvelles tentatives sur les statuts transitoires uniquement
+  private static readonly MAX_RETRIES = 2;
+  private static readonly RETRYABLE_STATUSES = new Set([429, 500, 502, 503, 504]);
+
+  // Cache des réponses par date : les textes d'une date donnée ne changent pas,
+  // re-sélectionner une date déjà chargée ne refait donc aucun appel réseau
+  private static readonly cache = new Map<string, AELFResponse>();
+
   static async getReadingsForDate(date: string): Promise<AELFResponse> {
+    const cached = this.cache.get(date);
+    if (cached) {
+      return cached;
+    }
+
+    const response = await this.fetchReadingsForDate(date);
+
+    // Ne mémoriser que les réponses réussies : un fallback (données simulées)
+    // doit pouvoir être retenté au prochain appel
+    if (!response.error) {
+      this.cache.set(date, response);
+    }
+
+    return response;
+  }
+
+  private static async fetchReadingsForDate(date: string): Promise<AELFResponse> {
     try {
       // Format de date pour l'API AELF (YYYY-MM-DD)
       const formattedDate = date; // La date est déjà au bon format
       const url = `${this.BASE_URL}/v1/messes/${formattedDate}/${this.ZONE}`;
+
+      // Journalisation de débogage réservée au mode développement :
+      // console.log est synchrone et sérialise ses arguments
+      if (import.meta.env.DEV) {
+        console.log('Appel API AELF:', url);
+      }
       
-      console.log('Appel API AELF:', url);
-      
-      const response = await fetch(url, {
-        method: 'GET',
-        headers: {
-          'Accept': 'application/json',
-          'Content-Type': 'application/json',
-          'User-Agent': 'Mozilla/5.0 (compatible; LiturgyApp/1.0)',
-          'Cache-Control': 'no-cache',
-          'Pragma': 'no-cache'
-        },
-        // Ajouter un timeout
-        signal: AbortSignal.timeout(30000), // 30 secondes
-      });
+      const response = await this.fetchWithRetry(url, 30000);
 
       if (!response.ok) {
         const errorMessage = `Erreur API AELF (${response.status}): ${response.statusText}`;
@@ -85,8 +122,10 @@ export class AELFService {
         return this.getMockReadings(date, 'Erreur de format dans la réponse de l\'API AELF');
       }
       
-      console.log('Réponse API AELF:', data);
-      
+      if (import.meta.env.DEV) {
+        console.log('Réponse API AELF:', data);
+      }
+
       return this.parseAELFResponse(data, date);
     } catch (error) {
       console.error('Erreur lors de la récupération des textes AELF:', error);
@@ -110,10 +149,10 @@ export class AELFService {
       
       const response = await fetch(directUrl, {
         method: 'GET',
+        // Même logique que l'appel principal : un seul en-tête simple pour
+        // éviter la requête préliminaire CORS sur l'accès direct
         headers: {
-          'Accept': 'application/json',
-          'Content-Type': 'application/json',
-          'User-Agent': 'Mozilla/5.0 (compatible; LiturgyApp/1.0)',
+          'Accept': 'application/json'
         },
         mode: 'cors',
         signal: AbortSignal.timeout(15000), // 15 secondes
@@ -142,6 +181,49 @@ export class AELFService {
     // Si tout échoue, retourner les données simulées
     return this.getMockReadings(date, 'Impossible de contacter l\'API AELF. Utilisation des données d\'exemple.');
   }
+
+  private static async fetchWithRetry(url: string, timeoutMs: number): Promise<Response> {
+    // Cet appel passe par le proxy same-origin (/api/aelf), donc pas de CORS ici.
+    // N'envoyer que Accept : Content-Type est sans objet sur un GET, User-Agent
+    // est un en-tête interdit que le navigateur ignore, et l'abandon de
+    // Cache-Control/Pragma: no-cache réactive le cache HTTP du navigateur pour
+    // les lectures — voulu, car les textes d'une date donnée ne changent pas
+    const init: RequestInit = {
+      method: 'GET',
+      headers: {
+        'Accept': 'application/json'
+      }
+    };
+
+    let response = await fetch(url, { ...init, signal: AbortSignal.timeout(timeoutMs) });
+
+    for (let attempt = 1; attempt <= this.MAX_RETRIES && this.RETRYABLE_STATUSES.has(response.status); attempt++) {
+      const delay = this.getRetryDelay(response, attempt);
+      console.warn(`API AELF ${response.status}, nouvelle tentative dans ${delay}ms (${attempt}/${this.MAX_RETRIES})`);
+      await new Promise(resolve => setTimeout(resolve, delay));
+      response = await fetch(url, { ...init, signal: AbortSignal.timeout(timeoutMs) });
+    }
+
+    return response;
+  }
+
+  // Délai avant nouvelle tentative : respecte l'en-tête Retry-After s'il est
+  // présent (secondes ou date HTTP), sinon backoff exponentiel (1 s puis 2 s)
+  private static getRetryDelay(response: Response, attempt: number): number {
+    const retryAfter = response.headers.get('Retry-After');
+    if (retryAfter) {
+      const seconds = Number(retryAfter);
+      if (!Number.isNaN(seconds)) {
+        return Math.min(seconds * 1000, 30000);
+      }
+      const retryDate = Date.parse(retryAfter);
+      if (!Number.isNaN(retryDate)) {
+        return Math.min(Math.max(retryDate - Date.now(), 0), 30000);
+      }
+    }
+    return 1000 * 2 ** (attempt - 1);
+  }
+
   private static parseAELFResponse(data: AELFApiResponse, date: string): AELFResponse {
     const readings: AELFResponse['readings'] = {};
 
@@ -237,18 +319,9 @@ export class AELFService {
     
     // Nettoyer le texte des balises HTML et caractères indésirables
     return text
-      .replace(/<[^>]*>/g, '') // Supprimer les balises HTML
-      .replace(/&nbsp;/g, ' ') // Remplacer les espaces insécables
-      .replace(/&amp;/g, '&') // Remplacer les entités HTML
-      .replace(/&lt;/g, '<')
-      .replace(/&gt;/g, '>')
-      .replace(/&quot;/g, '"')
-      .replace(/&#39;/g, "'")
-      .replace(/&rsquo;/g, "'")
-      .replace(/&lsquo;/g, "'")
-      .replace(/&rdquo;/g, '"')
-      .replace(/&ldquo;/g, '"')
-      .replace(/\s+/g, ' ') // Normaliser les espaces multiples
+      .replace(HTML_TAG_REGEX, '') // Supprimer les balises HTML
+      .replace(HTML_ENTITY_REGEX, entity => HTML_ENTITIES[entity]) // Remplacer les entités HTML en une seule passe
+      .replace(MULTIPLE_SPACES_REGEX, ' ') // Normaliser les espaces multiples
       .trim();
   }
 
@@ -1,12 +1,39 @@
 import PptxGenJS from 'pptxgenjs';
 import { LiturgyPresentation, LiturgyReading, Song, SlideItem } from '../types/liturgy';
-import { getLiturgicalSeason } from '../utils/liturgicalColors';
+import { getLiturgicalSeason, LiturgicalSeason } from '../utils/liturgicalColors';
 
 export class PowerPointService {
   private static readonly TARGET_WORDS_PER_SLIDE = 85; // Target 80-90 words
   private static readonly MIN_WORDS_PER_SLIDE = 80;
   private static readonly MAX_WORDS_PER_SLIDE = 90;
 
+  // Géométrie commune des zones de texte répétées sur chaque slide,
+  // définie une seule fois (seule la couleur varie selon le contexte)
+  private static readonly SLIDE_NUMBER_TEXT_OPTIONS = {
+    x: 9.2,
+    y: 7,
+    w: 0.5,
+    h: 0.3,
+    fontSize: 12,
+    align: 'center' as const,
+    fontFace: 'Arial'
+  };
+
+  private static readonly WORD_COUNT_TEXT_OPTIONS = {
+    x: 0.5,
+    y: 7.2,
+    w: 2,
+    h: 0.3,
+    fontSize: 10,
+    align: 'left' as const,
+    fontFace: 'Arial'
+  };
+
+  // Motifs de détection des sections de chant, définis une seule fois ;
+  // le drapeau i évite de créer une copie minuscule de chaque section
+  private static readonly REFRAIN_REGEX = /refrain/i;
+  private static readonly NUMBERED_VERSE_REGEX = /^(\d+)\./;
+
   static async exportPresentation(presentation: LiturgyPresentation): Promise<void> {
     const pptx = new PptxGenJS();
     
@@ -27,12 +54,16 @@ export class PowerPointService {
     // Créer la slide de titre (avec ou sans image)
     slideNumber += this.createTitleSlide(pptx, presentation, slideNumber);
 
+    // Indexer les lectures et chants une seule fois au lieu d'un find() par slide
+    const readingsById = new Map(presentation.readings.map(r => [r.id, r]));
+    const songsById = new Map(presentation.songs.map(s => [s.id, s]));
+
     // Slides dans l'ordre défini par l'utilisateur
     const sortedSlides = [...presentation.slideOrder].sort((a, b) => a.order - b.order);
-    
+
     for (const slideItem of sortedSlides) {
       if (slideItem.type === 'reading') {
-        const reading = presentation.readings.find(r => r.id === slideItem.id);
+        const reading = readingsById.get(slideItem.id);
         if (reading) {
           const readingSlides = this.createOptimizedReadingSlides(
             pptx, 
@@ -43,7 +74,7 @@ export class PowerPointService {
           slideNumber += readingSlides;
         }
       } else if (slideItem.type === 'song') {
-        const song = presentation.songs.find(s => s.id === slideItem.id);
+        const song = songsById.get(slideItem.id);
         if (song) {
           const songSlides = this.createOptimizedSongSlides(
             pptx, 
@@ -60,9 +91,11 @@ export class PowerPointService {
     const fileName = `${presentation.title}.pptx`;
     await pptx.writeFile({ fileName });
     
-    // Log pour le débogage
-    console.log(`📄 PowerPoint exporté: ${fileName}`);
-    console.log(`📊 ${slideNumber - 1} slides créées`);
+    // Log pour le débogage (mode développement uniquement)
+    if (import.meta.env.DEV) {
+      console.log(`📄 PowerPoint exporté: ${fileName}`);
+      console.log(`📊 ${slideNumber - 1} slides créées`);
+    }
   }
 
   private static createTitleSlide(
@@ -103,14 +136,8 @@ export class PowerPointService {
 
     // Numéro de slide
     titleSlide.addText(`${slideNumber}`, {
-      x: 9.2,
-      y: 7,
-      w: 0.5,
-      h: 0.3,
-      fontSize: 12,
-      color: 'FFFFFF',
-      align: 'center',
-      fontFace: 'Arial'
+      ...this.SLIDE_NUMBER_TEXT_OPTIONS,
+      color: 'FFFFFF'
     });
 
     return 1;
@@ -119,7 +146,7 @@ export class PowerPointService {
   private static createOptimizedReadingSlides(
     pptx: PptxGenJS, 
     reading: LiturgyReading, 
-    liturgicalSeason: any, 
+    liturgicalSeason: LiturgicalSeason, 
     startSlideNumber: number
   ): number {
     let slideCount = 0;
@@ -154,14 +181,8 @@ export class PowerPointService {
 
     // Numéro de slide
     titleSlide.addText(`${startSlideNumber + slideCount}`, {
-      x: 9.2,
-      y: 7,
-      w: 0.5,
-      h: 0.3,
-      fontSize: 12,
-      color: '64748B',
-      align: 'center',
-      fontFace: 'Arial'
+      ...this.SLIDE_NUMBER_TEXT_OPTIONS,
+      color: '64748B'
     });
 
     slideCount++;
@@ -204,26 +225,14 @@ export class PowerPointService {
 
       // Indicateur de nombre de mots (pour debug)
       slide.addText(`${chunk.wordCount} mots`, {
-        x: 0.5,
-        y: 7.2,
-        w: 2,
-        h: 0.3,
-        fontSize: 10,
-        color: '94A3B8',
-        align: 'left',
-        fontFace: 'Arial'
+        ...this.WORD_COUNT_TEXT_OPTIONS,
+        color: '94A3B8'
       });
 
       // Numéro de slide
       slide.addText(`${startSlideNumber + slideCount}`, {
-        x: 9.2,
-        y: 7,
-        w: 0.5,
-        h: 0.3,
-        fontSize: 12,
-        color: '64748B',
-        align: 'center',
-        fontFace: 'Arial'
+        ...this.SLIDE_NUMBER_TEXT_OPTIONS,
+        color: '64748B'
       });
 
       slideCount++;
@@ -235,7 +244,7 @@ export class PowerPointService {
   private static createOptimizedSongSlides(
     pptx: PptxGenJS, 
     song: Song, 
-    liturgicalSeason: any, 
+    liturgicalSeason: LiturgicalSeason, 
     startSlideNumber: number
   ): number {
     let slideCount = 0;
@@ -273,14 +282,8 @@ export class PowerPointService {
 
     // Numéro de slide
     titleSlide.addText(`${startSlideNumber + slideCount}`, {
-      x: 9.2,
-      y: 7,
-      w: 0.5,
-      h: 0.3,
-      fontSize: 12,
-      color: '92400E',
-      align: 'center',
-      fontFace: 'Arial'
+      ...this.SLIDE_NUMBER_TEXT_OPTIONS,
+      color: '92400E'
     });
 
     slideCount++;
@@ -323,26 +326,14 @@ export class PowerPointService {
 
       // Indicateur de nombre de mots
       slide.addText(`${verse.wordCount} mots`, {
-        x: 0.5,
-        y: 7.2,
-        w: 2,
-        h: 0.3,
-        fontSize: 10,
-        color: '92400E',
-        align: 'left',
-        fontFace: 'Arial'
+        ...this.WORD_COUNT_TEXT_OPTIONS,
+        color: '92400E'
       });
 
       // Numéro de slide
       slide.addText(`${startSlideNumber + slideCount}`, {
-        x: 9.2,
-        y: 7,
-        w: 0.5,
-        h: 0.3,
-        fontSize: 12,
-        color: '92400E',
-        align: 'center',
-        fontFace: 'Arial'
+        ...this.SLIDE_NUMBER_TEXT_OPTIONS,
+        color: '92400E'
       });
 
       slideCount++;
@@ -470,9 +461,9 @@ export class PowerPointService {
       if (trimmedPart.length === 0) continue;
 
       let type = 'verse';
-      if (trimmedPart.startsWith('R/') || trimmedPart.toLowerCase().includes('refrain')) {
+      if (trimmedPart.startsWith('R/') || this.REFRAIN_REGEX.test(trimmedPart)) {
         type = 'refrain';
-      } else if (/^\d+\./.test(trimmedPart)) {
+      } else if (this.NUMBERED_VERSE_REGEX.test(trimmedPart)) {
         type = 'numbered_verse';
       }
 
@@ -486,7 +477,9 @@ export class PowerPointService {
   }
 
   private static countWords(text: string): number {
-    return text.trim().split(/\s+/).filter(word => word.length > 0).length;
+    // Compter les mots en une seule passe, sans trim ni tableau filtré intermédiaire
+    const words = text.match(/\S+/g);
+    return words ? words.length : 0;
   }
 
   private static mergeSmallChunks(chunks: Array<{content: string, wordCount: number}>): Array<{content: string, wordCount: number}> {
@@ -517,13 +510,18 @@ export class PowerPointService {
     return mergedChunks;
   }
 
-  private static generateOptimizedVerseTitle(verse: any, songTitle: string, index: number, total: number): string {
+  private static generateOptimizedVerseTitle(
+    verse: { content: string; type: string },
+    songTitle: string,
+    index: number,
+    total: number
+  ): string {
     let baseTitle = songTitle;
     
     if (verse.type === 'refrain') {
       baseTitle += ' - Refrain';
     } else if (verse.type === 'numbered_verse') {
-      const match = verse.content.match(/^(\d+)\./);
+      const match = verse.content.match(this.NUMBERED_VERSE_REGEX);
       baseTitle += ` - Couplet ${match ? match[1] : index}`;
     } else {
       baseTitle += ` - Partie ${index}`;